@@ -1,2 +1,3 @@
 bind = "0.0.0.0:10000"
-workers = 2
\ No newline at end of file
+workers = 2
+worker_class = "uvicorn.workers.UvicornWorker"
\ No newline at end of file